@@ -381,6 +381,21 @@ describe("ArtifactService", () => {
       }
     });
 
+    it("throws ArtifactNotFoundError when searching without a slug", async () => {
+      // Create the artifacts directory so loadAllArtifactPaths doesn't fail
+      vol.mkdirSync(`${testBaseDir}/.kodebase/artifacts`, { recursive: true });
+
+      await expect(
+        service.getArtifact({ id: "Z", baseDir: testBaseDir }),
+      ).rejects.toThrow(ArtifactNotFoundError);
+      await expect(
+        service.getArtifact({ id: "Z", baseDir: testBaseDir }),
+      ).rejects.toMatchObject({
+        artifactId: "Z",
+        filePath: "<unknown path for Z>",
+      });
+    });
+
     it("re-throws non-ENOENT errors", async () => {
       // Create an initiative first
       const initiative = scaffoldInitiative({
@@ -155,51 +155,8 @@ export class ArtifactService {
   async getArtifact(options: GetArtifactOptions): Promise<TAnyArtifact> {
     const { id, slug, baseDir = process.cwd() } = options;
 
-    // If slug is provided, use direct path resolution
-    if (slug) {
-      const { filePath } = await resolveArtifactPaths({
-        id,
-        slug,
-        baseDir,
-      });
-
-      try {
-        await fs.access(filePath);
-      } catch (error) {
-        if ((error as NodeJS.ErrnoException).code === "ENOENT") {
-          throw new ArtifactNotFoundError(id, filePath);
-        }
-        throw error;
-      }
-
-      return await readArtifact<TAnyArtifact>(filePath);
-    }
-
-    // No slug provided - search for the artifact file
-    const artifactsRoot = path.join(baseDir, ARTIFACTS_DIR);
-    const allPaths = await loadAllArtifactPaths(artifactsRoot);
-
-    // Find matching artifact by ID
-    const matchingPath = allPaths.find((filePath: string) => {
-      const fileId = getArtifactIdFromPath(filePath);
-      return fileId === id;
-    });
-
-    if (!matchingPath) {
-      // For better error message, try to construct expected path
-      try {
-        const { filePath } = await resolveArtifactPaths({
-          id,
-          slug: "unknown",
-          baseDir,
-        });
-        throw new ArtifactNotFoundError(id, filePath);
-      } catch {
-        throw new ArtifactNotFoundError(id, `<unknown path for ${id}>`);
-      }
-    }
-
-    return await readArtifact<TAnyArtifact>(matchingPath);
+    const filePath = await this.resolveExistingArtifactPath(id, slug, baseDir);
+    return await readArtifact<TAnyArtifact>(filePath);
   }
 
   /**
@@ -230,8 +187,9 @@ export class ArtifactService {
   async updateMetadata(options: UpdateMetadataOptions): Promise<TAnyArtifact> {
     const { id, updates, slug, baseDir = process.cwd() } = options;
 
-    // Get existing artifact
-    const artifact = await this.getArtifact({ id, slug, baseDir });
+    // Resolve the file path once and reuse it for both read and write
+    const filePath = await this.resolveExistingArtifactPath(id, slug, baseDir);
+    const artifact = await readArtifact<TAnyArtifact>(filePath);
 
     // Preserve events array and apply updates
     const preservedEvents = artifact.metadata.events;
@@ -244,33 +202,6 @@ export class ArtifactService {
       },
     };
 
-    // Determine the file path
-    let filePath: string;
-
-    if (slug) {
-      // Slug provided - use it directly
-      ({ filePath } = await resolveArtifactPaths({
-        id,
-        slug,
-        baseDir,
-      }));
-    } else {
-      // No slug provided - find the actual file path to preserve slugs in filenames
-      const artifactsRoot = path.join(baseDir, ARTIFACTS_DIR);
-      const allPaths = await loadAllArtifactPaths(artifactsRoot);
-
-      const matchingPath = allPaths.find((p: string) => {
-        const fileId = getArtifactIdFromPath(p);
-        return fileId === id;
-      });
-
-      if (!matchingPath) {
-        throw new ArtifactNotFoundError(id, `<unknown path for ${id}>`);
-      }
-
-      filePath = matchingPath;
-    }
-
     // Write updated artifact
     await writeArtifact(filePath, updatedArtifact);
 
@@ -306,8 +237,9 @@ export class ArtifactService {
   async appendEvent(options: AppendEventOptions): Promise<TAnyArtifact> {
     const { id, event, slug, baseDir = process.cwd() } = options;
 
-    // Get existing artifact
-    const artifact = await this.getArtifact({ id, slug, baseDir });
+    // Resolve the file path once and reuse it for both read and write
+    const filePath = await this.resolveExistingArtifactPath(id, slug, baseDir);
+    const artifact = await readArtifact<TAnyArtifact>(filePath);
 
     // Create new events array with appended event (immutability)
     const updatedArtifact = {
@@ -318,36 +250,61 @@ export class ArtifactService {
       },
     };
 
-    // Determine the file path
-    let filePath: string;
+    // Write updated artifact
+    await writeArtifact(filePath, updatedArtifact);
 
+    return updatedArtifact;
+  }
+
+  /**
+   * Resolves the file path of an existing artifact.
+   *
+   * When a slug is provided the path is resolved directly; otherwise the
+   * artifacts directory is scanned once to find the file (preserving any
+   * slug already present in the filename).
+   *
+   * @param id - The artifact ID
+   * @param slug - Optional slug if the artifact has one
+   * @param baseDir - Base directory of the project
+   * @returns Path to the artifact file
+   * @throws ArtifactNotFoundError if the artifact file doesn't exist
+   */
+  private async resolveExistingArtifactPath(
+    id: string,
+    slug: string | undefined,
+    baseDir: string,
+  ): Promise<string> {
     if (slug) {
-      // Slug provided - use it directly
-      ({ filePath } = await resolveArtifactPaths({
+      const { filePath } = await resolveArtifactPaths({
         id,
         slug,
         baseDir,
-      }));
-    } else {
-      // No slug provided - find the actual file path to preserve slugs in filenames
-      const artifactsRoot = path.join(baseDir, ARTIFACTS_DIR);
-      const allPaths = await loadAllArtifactPaths(artifactsRoot);
-
-      const matchingPath = allPaths.find((p: string) => {
-        const fileId = getArtifactIdFromPath(p);
-        return fileId === id;
       });
 
-      if (!matchingPath) {
-        throw new ArtifactNotFoundError(id, `<unknown path for ${id}>`);
+      try {
+        await fs.access(filePath);
+      } catch (error) {
+        if ((error as NodeJS.ErrnoException).code === "ENOENT") {
+          throw new ArtifactNotFoundError(id, filePath);
+        }
+        throw error;
       }
 
-      filePath = matchingPath;
+      return filePath;
     }
 
-    // Write updated artifact
-    await writeArtifact(filePath, updatedArtifact);
+    const artifactsRoot = path.join(baseDir, ARTIFACTS_DIR);
+    const allPaths = await loadAllArtifactPaths(artifactsRoot);
 
-    return updatedArtifact;
+    const matchingPath = allPaths.find((p: string) => {
+      const fileId = getArtifactIdFromPath(p);
+      return fileId === id;
+    });
+
+    if (!matchingPath) {
+      throw new ArtifactNotFoundError(id, `<unknown path for ${id}>`);
+    }
+
+    return matchingPath;
   }
 }
@@ -0,0 +1,71 @@
+import { describe, expect, it } from "vitest";
+
+import { mapInBatches, mapInBatchesSkippingErrors } from "./batch-utils.js";
+
+describe("batch-utils", () => {
+  const range = (n: number) => Array.from({ length: n }, (_, i) => i);
+
+  describe("mapInBatches", () => {
+    it("returns results in input order across batch boundaries", async () => {
+      const items = range(70);
+
+      const results = await mapInBatches(items, 32, async (n) => {
+        // Resolve later items first to make ordering bugs visible
+        await new Promise((resolve) => setTimeout(resolve, (70 - n) % 5));
+        return n * 2;
+      });
+
+      expect(results).toEqual(items.map((n) => n * 2));
+    });
+
+    it("never runs more than `limit` calls at once", async () => {
+      let active = 0;
+      let maxActive = 0;
+
+      await mapInBatches(range(100), 32, async () => {
+        active++;
+        maxActive = Math.max(maxActive, active);
+        await new Promise((resolve) => setTimeout(resolve, 1));
+        active--;
+      });
+
+      expect(maxActive).toBeLessThanOrEqual(32);
+    });
+
+    it("rejects when any call rejects", async () => {
+      await expect(
+        mapInBatches(range(40), 32, async (n) => {
+          if (n === 35) {
+            throw new Error("boom");
+          }
+          return n;
+        }),
+      ).rejects.toThrow("boom");
+    });
+
+    it("returns an empty array for no items", async () => {
+      const results = await mapInBatches([], 32, async (n: number) => n);
+
+      expect(results).toEqual([]);
+    });
+  });
+
+  describe("mapInBatchesSkippingErrors", () => {
+    it("skips failed items and keeps order across batch boundaries", async () => {
+      const failing = new Set([3, 31, 32, 65]);
+
+      const results = await mapInBatchesSkippingErrors(
+        range(70),
+        32,
+        async (n) => {
+          if (failing.has(n)) {
+            throw new Error(`failed ${n}`);
+          }
+          return n;
+        },
+      );
+
+      expect(results).toEqual(range(70).filter((n) => !failing.has(n)));
+    });
+  });
+});
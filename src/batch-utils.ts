@@ -0,0 +1,77 @@
+/**
+ * Internal helpers for bounded concurrent processing.
+ *
+ * Used by the query and dependency graph services to read artifact files
+ * concurrently without exhausting file descriptors on large trees.
+ *
+ * @module batch-utils
+ * @internal
+ */
+
+/** Maximum number of artifact files read concurrently (keeps well below fd limits) */
+export const MAX_CONCURRENT_READS = 32;
+
+/**
+ * Maps items through an async function, running at most `limit` calls at once.
+ *
+ * Items are processed in consecutive batches of `limit`. Results are returned
+ * in the same order as the input. The first rejection rejects the whole call.
+ *
+ * @param items - Items to process
+ * @param limit - Maximum number of concurrent calls to `fn`
+ * @param fn - Async function applied to each item
+ * @returns Results in input order
+ *
+ * @example
+ * ```ts
+ * const artifacts = await mapInBatches(paths, MAX_CONCURRENT_READS, readArtifact);
+ * ```
+ */
+export async function mapInBatches<T, R>(
+  items: readonly T[],
+  limit: number,
+  fn: (item: T) => Promise<R>,
+): Promise<R[]> {
+  const results: R[] = [];
+
+  for (let i = 0; i < items.length; i += limit) {
+    const batch = await Promise.all(items.slice(i, i + limit).map(fn));
+    results.push(...batch);
+  }
+
+  return results;
+}
+
+/**
+ * Like {@link mapInBatches}, but skips items whose call rejects.
+ *
+ * Used where unreadable artifacts should be ignored rather than fail the
+ * whole operation. Results for the remaining items keep their input order.
+ *
+ * @param items - Items to process
+ * @param limit - Maximum number of concurrent calls to `fn`
+ * @param fn - Async function applied to each item
+ * @returns Results of the successful calls, in input order
+ */
+export async function mapInBatchesSkippingErrors<T, R>(
+  items: readonly T[],
+  limit: number,
+  fn: (item: T) => Promise<R>,
+): Promise<R[]> {
+  const settled = await mapInBatches(items, limit, async (item) => {
+    try {
+      return { ok: true as const, value: await fn(item) };
+    } catch {
+      return { ok: false as const };
+    }
+  });
+
+  const results: R[] = [];
+  for (const result of settled) {
+    if (result.ok) {
+      results.push(result.value);
+    }
+  }
+
+  return results;
+}
@@ -910,6 +910,11 @@ describe("CascadeService", () => {
       expect(result.updatedArtifacts).toHaveLength(2);
       expect(result.updatedArtifacts[0]?.metadata.title).toBe("Milestone A.1");
       expect(result.updatedArtifacts[1]?.metadata.title).toBe("Initiative A");
+      // Returned artifacts include the appended in_progress event
+      for (const updated of result.updatedArtifacts) {
+        const events = updated.metadata.events;
+        expect(events[events.length - 1]?.event).toBe("in_progress");
+      }
       expect(result.events).toHaveLength(2);
       // First event is for the milestone (direct parent)
       expect(result.events[0]?.artifactId).toBe("A.1");
@@ -1566,6 +1571,216 @@ describe("CascadeService", () => {
     });
   });
 
+  describe("default parameters", () => {
+    it("uses process.cwd() for readiness cascade when baseDir is not provided", async () => {
+      // Arrange: A.2 blocked by A.1, A.1 completed
+      await artifactService.createArtifact({
+        id: "A",
+        artifact: scaffoldInitiative({
+          title: "Initiative A",
+          createdBy: "Test User (test@example.com)",
+          vision: "Test vision",
+          scopeIn: ["Feature A"],
+          scopeOut: ["Feature Z"],
+          successCriteria: ["Criterion A"],
+        }),
+        slug: "initiative-a",
+        baseDir: testBaseDir,
+      });
+
+      await artifactService.createArtifact({
+        id: "A.1",
+        artifact: scaffoldMilestone({
+          title: "Milestone A.1",
+          createdBy: "Test User (test@example.com)",
+          summary: "Blocker milestone",
+          deliverables: ["Deliverable 1"],
+        }),
+        slug: "milestone-a1",
+        baseDir: testBaseDir,
+      });
+
+      const a2 = scaffoldMilestone({
+        title: "Milestone A.2",
+        createdBy: "Test User (test@example.com)",
+        summary: "Dependent milestone",
+        deliverables: ["Deliverable 2"],
+      });
+      a2.metadata.relationships.blocked_by = ["A.1"];
+
+      await artifactService.createArtifact({
+        id: "A.2",
+        artifact: a2,
+        slug: "milestone-a2",
+        baseDir: testBaseDir,
+      });
+
+      await artifactService.appendEvent({
+        id: "A.2",
+        slug: "milestone-a2",
+        event: {
+          event: "blocked",
+          timestamp: "2025-01-01T10:00:00Z",
+          actor: "Test User",
+          trigger: "has_dependencies",
+          metadata: {
+            blocking_dependencies: [
+              {
+                artifact_id: "A.1",
+                resolved: false,
+              },
+            ],
+          },
+        },
+        baseDir: testBaseDir,
+      });
+
+      await artifactService.appendEvent({
+        id: "A.1",
+        slug: "milestone-a1",
+        event: {
+          event: "completed",
+          timestamp: "2025-01-01T12:00:00Z",
+          actor: "Test User",
+          trigger: "pr_merged",
+        },
+        baseDir: testBaseDir,
+      });
+
+      // Mock process.cwd() to return our test directory
+      const originalCwd = process.cwd;
+      process.cwd = vi.fn(() => testBaseDir);
+
+      try {
+        // Act: No baseDir provided - should use process.cwd()
+        const result = await cascadeService.executeReadinessCascade({
+          completedArtifactId: "A.1",
+        });
+
+        // Assert: A.2 moved to ready on disk under process.cwd()
+        expect(result.events).toHaveLength(1);
+        expect(result.events[0]?.artifactId).toBe("A.2");
+        expect(result.events[0]?.event).toBe("ready");
+
+        const updated = await artifactService.getArtifact({
+          id: "A.2",
+          slug: "milestone-a2",
+          baseDir: testBaseDir,
+        });
+        const lastEvent =
+          updated.metadata.events[updated.metadata.events.length - 1];
+        expect(lastEvent?.event).toBe("ready");
+      } finally {
+        process.cwd = originalCwd;
+      }
+    });
+
+    it("uses process.cwd() for progress cascade when baseDir is not provided", async () => {
+      // Arrange: A (ready) → A.1 (ready) → A.1.1 (in_progress)
+      await artifactService.createArtifact({
+        id: "A",
+        artifact: scaffoldInitiative({
+          title: "Initiative A",
+          createdBy: "Test User (test@example.com)",
+          vision: "Test vision",
+          scopeIn: ["Feature A"],
+          scopeOut: ["Feature Z"],
+          successCriteria: ["Criterion A"],
+        }),
+        slug: "initiative-a",
+        baseDir: testBaseDir,
+      });
+
+      await artifactService.appendEvent({
+        id: "A",
+        slug: "initiative-a",
+        event: {
+          event: "ready",
+          timestamp: "2025-01-01T09:00:00Z",
+          actor: "Test User",
+          trigger: "dependencies_met",
+        },
+        baseDir: testBaseDir,
+      });
+
+      await artifactService.createArtifact({
+        id: "A.1",
+        artifact: scaffoldMilestone({
+          title: "Milestone A.1",
+          createdBy: "Test User (test@example.com)",
+          summary: "Test milestone",
+          deliverables: ["Deliverable 1"],
+        }),
+        slug: "milestone-a1",
+        baseDir: testBaseDir,
+      });
+
+      await artifactService.appendEvent({
+        id: "A.1",
+        slug: "milestone-a1",
+        event: {
+          event: "ready",
+          timestamp: "2025-01-01T09:30:00Z",
+          actor: "Test User",
+          trigger: "dependencies_met",
+        },
+        baseDir: testBaseDir,
+      });
+
+      await artifactService.createArtifact({
+        id: "A.1.1",
+        artifact: scaffoldIssue({
+          title: "Issue A.1.1",
+          createdBy: "Test User (test@example.com)",
+          summary: "Test issue",
+          acceptanceCriteria: ["Criterion 1"],
+        }),
+        slug: "issue-a11",
+        baseDir: testBaseDir,
+      });
+
+      await artifactService.appendEvent({
+        id: "A.1.1",
+        slug: "issue-a11",
+        event: {
+          event: "in_progress",
+          timestamp: "2025-01-01T10:00:00Z",
+          actor: "Test User",
+          trigger: "branch_created",
+        },
+        baseDir: testBaseDir,
+      });
+
+      // Mock process.cwd() to return our test directory
+      const originalCwd = process.cwd;
+      process.cwd = vi.fn(() => testBaseDir);
+
+      try {
+        // Act: No baseDir provided - should use process.cwd()
+        const result = await cascadeService.executeProgressCascade({
+          artifactId: "A.1.1",
+          trigger: "branch_created",
+        });
+
+        // Assert: Milestone and initiative moved to in_progress under process.cwd()
+        expect(result.events.map((e) => e.artifactId)).toEqual(["A.1", "A"]);
+
+        const updatedParent = await artifactService.getArtifact({
+          id: "A.1",
+          slug: "milestone-a1",
+          baseDir: testBaseDir,
+        });
+        const lastEvent =
+          updatedParent.metadata.events[
+            updatedParent.metadata.events.length - 1
+          ];
+        expect(lastEvent?.event).toBe("in_progress");
+      } finally {
+        process.cwd = originalCwd;
+      }
+    });
+  });
+
   describe("type exports", () => {
     it("should export CascadeResult type", () => {
       const result: CascadeResult = {
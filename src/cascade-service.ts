@@ -20,7 +20,15 @@
  */
 
 import type { TAnyArtifact } from "@kodebase/core";
-import { CArtifactEvent, CascadeEngine, CEventTrigger } from "@kodebase/core";
+import {
+  CArtifactEvent,
+  CascadeEngine,
+  CEventTrigger,
+  getArtifactIdFromPath,
+  loadAllArtifactPaths,
+  resolveArtifactPaths,
+  writeArtifact,
+} from "@kodebase/core";
 
 import { ArtifactService } from "./artifact-service.js";
 import { DependencyGraphService } from "./dependency-graph-service.js";
@@ -342,7 +350,11 @@ export class CascadeService {
       events: [],
     };
 
-    const { completedArtifactId, actor = "agent.cascade", baseDir } = options;
+    const {
+      completedArtifactId,
+      actor = "agent.cascade",
+      baseDir = process.cwd(),
+    } = options;
 
     // 1. Find all artifacts blocked by this completed artifact
     // Create fresh DependencyGraphService to avoid stale cache
@@ -365,12 +377,6 @@ export class CascadeService {
     const timestamp = new Date().toISOString();
 
     // Load artifact paths once for performance (used in slug extraction)
-    const {
-      loadAllArtifactPaths,
-      getArtifactIdFromPath,
-      resolveArtifactPaths,
-      writeArtifact,
-    } = await import("@kodebase/core");
     const artifactsRoot = `${baseDir}/.kodebase/artifacts`;
     const allPaths = await loadAllArtifactPaths(artifactsRoot);
 
@@ -510,7 +516,7 @@ export class CascadeService {
       events: [],
     };
 
-    const { artifactId, actor, baseDir } = options;
+    const { artifactId, actor, baseDir = process.cwd() } = options;
 
     // 1. Extract parent ID from artifact ID
     const parentId = this.getParentId(artifactId);
@@ -528,27 +534,15 @@ export class CascadeService {
       // Load siblings (which also verifies parent exists)
       siblings = await queryService.getChildren(parentId);
 
-      // Load parent artifact using QueryService (no slug needed)
-      const ancestors = await queryService.getAncestors(artifactId);
-      const parentArtifact = ancestors.find((a) => a.id === parentId);
+      // Parent is already cached by getChildren (no slug needed)
+      const parentArtifact = await queryService.findById(parentId);
       if (!parentArtifact) {
-        throw new Error(`Parent ${parentId} not found in ancestors`);
+        throw new Error(`Parent ${parentId} not found`);
       }
       parent = parentArtifact.artifact;
 
-      // Extract slug from directory path by checking the filesystem
-      // Use loadAllArtifactPaths to get all paths, then find parent's path
-      const { loadAllArtifactPaths, getArtifactIdFromPath } = await import(
-        "@kodebase/core"
-      );
-      const artifactsRoot = `${baseDir}/.kodebase/artifacts`;
-      const allPaths = await loadAllArtifactPaths(artifactsRoot);
-
-      // Find the path for the parent artifact
-      const parentPath = allPaths.find((p) => {
-        const id = getArtifactIdFromPath(p);
-        return id === parentId;
-      });
+      // Extract slug from the parent's path, reusing the QueryService path cache
+      const parentPath = await queryService.getArtifactPath(parentId);
 
       if (!parentPath) {
         throw new Error(`Parent ${parentId} path not found in artifact paths`);
@@ -606,23 +600,15 @@ export class CascadeService {
       "progress_cascade",
     );
 
-    // 8. Append in_progress event to parent
-    await this.artifactService.appendEvent({
+    // 8. Append in_progress event to parent (returns the updated artifact)
+    const updatedParent = await this.artifactService.appendEvent({
       id: parentId,
       slug: parentSlug,
       event: cascadeEvent,
       baseDir,
     });
 
-    // 9. Reload parent to get updated artifact (using QueryService to avoid slug issues)
-    const reloadedAncestors = await queryService.getAncestors(artifactId);
-    const reloadedParent = reloadedAncestors.find((a) => a.id === parentId);
-    if (!reloadedParent) {
-      throw new Error(`Failed to reload parent ${parentId} after cascade`);
-    }
-    const updatedParent = reloadedParent.artifact;
-
-    // 10. Add to result
+    // 9. Add to result
     result.updatedArtifacts.push(updatedParent);
     result.events.push({
       artifactId: parentId,
@@ -632,7 +618,7 @@ export class CascadeService {
       trigger: cascadeEvent.trigger,
     });
 
-    // 11. Recursively cascade to grandparent if parent was updated
+    // 10. Recursively cascade to grandparent if parent was updated
     // This handles the chain: Issue A.1.1 → Milestone A.1 → Initiative A
     const grandparentResult = await this.executeProgressCascade({
       artifactId: parentId,
@@ -20,6 +20,7 @@ import { afterEach, beforeEach, describe, expect, it, vi } from "vitest";
 
 import { ArtifactService } from "./artifact-service.js";
 import { generateArtifactContext } from "./context-generator.js";
+import { QueryService } from "./query-service.js";
 
 describe("generateArtifactContext", () => {
   const testBaseDir = "/test-workspace";
@@ -255,6 +256,17 @@ describe("generateArtifactContext", () => {
       ).rejects.toThrow("Artifact Z.9.9 not found");
     });
 
+    it("should throw not found error for an unreadable artifact", async () => {
+      await createTestHierarchy();
+
+      const filePath = `${testBaseDir}/.kodebase/artifacts/A.core-platform/A.1.authentication-system/A.1.1.implement-oauth2-flow.yml`;
+      vol.writeFileSync(filePath, "metadata: [unclosed");
+
+      await expect(
+        generateArtifactContext("A.1.1", { baseDir: testBaseDir }),
+      ).rejects.toThrow("Artifact A.1.1 not found");
+    });
+
     it("should handle artifacts with no relationships", async () => {
       // Create a simple initiative with no relationships
       const initiative = scaffoldInitiative({
@@ -284,6 +296,29 @@ describe("generateArtifactContext", () => {
     });
   });
 
+  describe("Shared QueryService", () => {
+    it("should reuse a provided query service across calls", async () => {
+      await createTestHierarchy();
+
+      const queryService = new QueryService(testBaseDir);
+      const first = await generateArtifactContext("A.1.1", {
+        baseDir: testBaseDir,
+        queryService,
+      });
+
+      // Remove the artifacts from disk; cached data should still be served
+      vol.rmSync(`${testBaseDir}/.kodebase`, { recursive: true });
+
+      const second = await generateArtifactContext("A.1.1", {
+        baseDir: testBaseDir,
+        queryService,
+      });
+
+      expect(second).toBe(first);
+      expect(second).toContain("# Artifact A.1.1: Implement OAuth2 flow");
+    });
+  });
+
   describe("Markdown Formatting", () => {
     it("should use proper markdown headers", async () => {
       await createTestHierarchy();
@@ -16,6 +16,8 @@ export interface ContextGenerationOptions {
   includeParents?: boolean;
   /** Include file paths if available */
   includeFiles?: boolean;
+  /** Shared QueryService to reuse caches across calls (takes precedence over baseDir; call clearCache() after artifact writes) */
+  queryService?: QueryService;
 }
 
 /**
@@ -42,13 +44,14 @@ export async function generateArtifactContext(
   artifactId: string,
   options: ContextGenerationOptions = {},
 ): Promise<string> {
-  const { baseDir = process.cwd(), includeParents = true } = options;
-
-  const queryService = new QueryService(baseDir);
+  const {
+    baseDir = process.cwd(),
+    includeParents = true,
+    queryService = new QueryService(baseDir),
+  } = options;
 
   // Load the artifact
-  const results = await queryService.findArtifacts({});
-  const artifactWithId = results.find((a) => a.id === artifactId);
+  const artifactWithId = await queryService.findById(artifactId);
 
   if (!artifactWithId) {
     throw new Error(`Artifact ${artifactId} not found`);
@@ -318,6 +318,15 @@ describe("ContextService", () => {
         ArtifactError,
       );
     });
+
+    it("throws ArtifactError for prefix-only branch names", async () => {
+      await expect(service.detectFromBranch("add/")).rejects.toThrow(
+        ArtifactError,
+      );
+      await expect(service.detectFromBranch("complete/")).rejects.toThrow(
+        ArtifactError,
+      );
+    });
   });
 
   describe("detectFromPath", () => {
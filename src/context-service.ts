@@ -13,6 +13,14 @@ import { NotInKodebaseProjectError } from "./errors.js";
 const ARTIFACTS_DIR = ".kodebase/artifacts";
 const KODEBASE_DIR = ".kodebase";
 
+// Branch name prefixes used by Kodebase workflows (add/A.1.3, complete/A.1)
+const ADD_BRANCH_PREFIX = "add/";
+const COMPLETE_BRANCH_PREFIX = "complete/";
+// Full artifact ID (A, A.1, A.1.3, AA.2.1, ...)
+const ARTIFACT_ID_FORMAT_REGEX = /^[A-Z]+(?:\.\d+)*$/;
+// Artifact ID prefix of a directory name (A.core, A.1.types, ...)
+const ARTIFACT_DIR_ID_REGEX = /^([A-Z]+(?:\.\d+)*)\./;
+
 /**
  * Context information for the current working environment.
  */
@@ -103,22 +111,18 @@ export class ContextService {
    */
   async detectFromBranch(branchName: string): Promise<ContextInfo> {
     // Parse branch name patterns: add/*, complete/*, or direct artifact ID
-    const addMatch = branchName.match(/^add\/(.+)$/);
-    const completeMatch = branchName.match(/^complete\/(.+)$/);
-
     let artifactId: string;
-    if (addMatch) {
-      artifactId = addMatch[1] ?? "";
-    } else if (completeMatch) {
-      artifactId = completeMatch[1] ?? "";
+    if (branchName.startsWith(ADD_BRANCH_PREFIX)) {
+      artifactId = branchName.slice(ADD_BRANCH_PREFIX.length);
+    } else if (branchName.startsWith(COMPLETE_BRANCH_PREFIX)) {
+      artifactId = branchName.slice(COMPLETE_BRANCH_PREFIX.length);
     } else {
       // Assume direct artifact ID (implementation branch)
       artifactId = branchName;
     }
 
     // Validate artifact ID format
-    const idPattern = /^[A-Z]+(?:\.\d+)*$/;
-    if (!idPattern.test(artifactId)) {
+    if (!ARTIFACT_ID_FORMAT_REGEX.test(artifactId)) {
       throw new ArtifactError({
         code: "INVALID_BRANCH_NAME",
         message: `Branch name "${branchName}" does not match Kodebase conventions. Expected patterns: add/A.1.3, A.1.3, or complete/A.1`,
@@ -212,7 +216,7 @@ export class ContextService {
     // Format: A.slug, A.1.slug, etc.
     const dirIds: string[] = [];
     for (const segment of pathSegments) {
-      const idMatch = segment.match(/^([A-Z]+(?:\.\d+)*)\./);
+      const idMatch = segment.match(ARTIFACT_DIR_ID_REGEX);
       if (idMatch) {
         dirIds.push(idMatch[1] ?? "");
       }
@@ -21,6 +21,10 @@ import {
   validateRelationshipConsistency,
 } from "@kodebase/core";
 
+import {
+  MAX_CONCURRENT_READS,
+  mapInBatchesSkippingErrors,
+} from "./batch-utils.js";
 import { ArtifactNotFoundError } from "./errors.js";
 import type { ArtifactWithId } from "./query-service.js";
 
@@ -127,22 +131,23 @@ export class DependencyGraphService {
    */
   private async loadAllArtifacts(): Promise<Map<string, TAnyArtifact>> {
     const pathCache = await this.loadPathCache();
-    const artifacts = new Map<string, TAnyArtifact>();
 
-    for (const [id, path] of pathCache) {
-      const cached = this.cache.get(id);
-      if (cached) {
-        artifacts.set(id, cached);
-      } else {
-        try {
-          const artifact = await readArtifact<TAnyArtifact>(path);
-          this.cache.set(id, artifact);
-          artifacts.set(id, artifact);
-        } catch {}
-      }
-    }
+    // Read uncached artifacts in bounded concurrent batches, skipping any that fail to load
+    const entries = await mapInBatchesSkippingErrors(
+      Array.from(pathCache),
+      MAX_CONCURRENT_READS,
+      async ([id, path]) => {
+        const cached = this.cache.get(id);
+        if (cached) {
+          return [id, cached] as const;
+        }
+        const artifact = await readArtifact<TAnyArtifact>(path);
+        this.cache.set(id, artifact);
+        return [id, artifact] as const;
+      },
+    );
 
-    return artifacts;
+    return new Map(entries);
   }
 
   /**
@@ -4,6 +4,10 @@ import {
   loadArtifactsByType,
 } from "@kodebase/core";
 
+// Valid parent ID formats, compiled once at module load
+const INITIATIVE_ID_REGEX = /^[A-Z]+$/;
+const MILESTONE_ID_REGEX = /^[A-Z]+\.\d+$/;
+
 /**
  * Service for allocating unique IDs for Kodebase artifacts.
  *
@@ -279,7 +283,7 @@ export class IdAllocationService {
    * @internal
    */
   private validateInitiativeId(id: string): void {
-    if (!/^[A-Z]+$/.test(id)) {
+    if (!INITIATIVE_ID_REGEX.test(id)) {
       throw new Error(
         `Invalid initiative ID: ${id}. Must be uppercase letters only (A-Z, AA-ZZ, etc.)`,
       );
@@ -296,7 +300,7 @@ export class IdAllocationService {
    * @internal
    */
   private validateMilestoneId(id: string): void {
-    if (!/^[A-Z]+\.\d+$/.test(id)) {
+    if (!MILESTONE_ID_REGEX.test(id)) {
       throw new Error(
         `Invalid milestone ID: ${id}. Must be in format <initiative>.<number> (e.g., A.1, AA.2)`,
       );
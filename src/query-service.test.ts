@@ -407,6 +407,54 @@ describe("QueryService", () => {
     });
   });
 
+  describe("findById", () => {
+    it("finds an artifact by its ID", async () => {
+      await createSimpleHierarchy();
+
+      const result = await queryService.findById("A.1.2");
+
+      expect(result?.id).toBe("A.1.2");
+      expect(result?.artifact.metadata.title).toBe("Issue A.1.2");
+    });
+
+    it("returns null when artifact doesn't exist", async () => {
+      await createSimpleHierarchy();
+
+      const result = await queryService.findById("Z.9.9");
+
+      expect(result).toBeNull();
+    });
+
+    it("returns null when the artifact file cannot be read", async () => {
+      await createSimpleHierarchy();
+
+      const filePath = await queryService.getArtifactPath("A.1.2");
+      vol.writeFileSync(filePath as string, "metadata: [unclosed");
+
+      const result = await queryService.findById("A.1.2");
+
+      expect(result).toBeNull();
+    });
+  });
+
+  describe("getArtifactPath", () => {
+    it("returns the file path for an artifact", async () => {
+      await createSimpleHierarchy();
+
+      const filePath = await queryService.getArtifactPath("A.1");
+
+      expect(filePath).toContain("A.initiative-a/A.1.milestone-a1/A.1.yml");
+    });
+
+    it("returns null when artifact doesn't exist", async () => {
+      await createSimpleHierarchy();
+
+      const filePath = await queryService.getArtifactPath("Z.9");
+
+      expect(filePath).toBeNull();
+    });
+  });
+
   describe("clearCache", () => {
     it("clears the cache and forces reload", async () => {
       await createSimpleHierarchy();
@@ -564,6 +612,83 @@ describe("QueryService", () => {
     });
   });
 
+  describe("batched loading", () => {
+    /**
+     * Creates A → A.1 → 40 issues, so bulk reads span more than one batch.
+     */
+    async function createLargeMilestone(): Promise<void> {
+      await artifactService.createArtifact({
+        id: "A",
+        artifact: scaffoldInitiative({
+          title: "Initiative A",
+          createdBy: "Test User (test@example.com)",
+          vision: "Vision A",
+          scopeIn: ["Feature A"],
+          scopeOut: ["Feature Z"],
+          successCriteria: ["Criterion A"],
+        }),
+        slug: "initiative-a",
+        baseDir: testBaseDir,
+      });
+
+      await artifactService.createArtifact({
+        id: "A.1",
+        artifact: scaffoldMilestone({
+          title: "Milestone A.1",
+          createdBy: "Test User (test@example.com)",
+          summary: "Summary A.1",
+          deliverables: ["Deliverable A.1"],
+        }),
+        slug: "milestone-a1",
+        baseDir: testBaseDir,
+      });
+
+      for (let i = 1; i <= 40; i++) {
+        await artifactService.createArtifact({
+          id: `A.1.${i}`,
+          artifact: scaffoldIssue({
+            title: `Issue A.1.${i}`,
+            createdBy: "Test User (test@example.com)",
+            summary: `Summary A.1.${i}`,
+            acceptanceCriteria: [`AC ${i}`],
+          }),
+          slug: `issue-${i}`,
+          baseDir: testBaseDir,
+        });
+      }
+    }
+
+    it("loads all children of a large milestone", async () => {
+      await createLargeMilestone();
+
+      const children = await queryService.getChildren("A.1");
+
+      expect(children).toHaveLength(40);
+      expect(new Set(children.map((c) => c.id)).size).toBe(40);
+    });
+
+    it("preserves order and skips unreadable artifacts across batches", async () => {
+      await createLargeMilestone();
+
+      const expectedIds = (await queryService.findByType("issue")).map(
+        (item) => item.id,
+      );
+      expect(expectedIds).toHaveLength(40);
+
+      // Corrupt one issue file so it fails to parse
+      const corruptPath = await queryService.getArtifactPath("A.1.35");
+      expect(corruptPath).not.toBeNull();
+      vol.writeFileSync(corruptPath as string, "metadata: [unclosed");
+      queryService.clearCache();
+
+      const results = await queryService.findByType("issue");
+
+      expect(results.map((item) => item.id)).toEqual(
+        expectedIds.filter((id) => id !== "A.1.35"),
+      );
+    });
+  });
+
   describe("lazy loading", () => {
     it("only loads artifacts when methods are called", async () => {
       await createSimpleHierarchy();
@@ -20,6 +20,11 @@ import {
   type TSortOrder,
 } from "@kodebase/core";
 
+import {
+  MAX_CONCURRENT_READS,
+  mapInBatches,
+  mapInBatchesSkippingErrors,
+} from "./batch-utils.js";
 import { ArtifactNotFoundError } from "./errors.js";
 
 /**
@@ -354,14 +359,12 @@ export class QueryService {
     await this.loadArtifact(parentId);
 
     const childIds = await this.getChildIds(parentId);
-    const children: ArtifactWithId[] = [];
-
-    for (const childId of childIds) {
-      const artifact = await this.loadArtifact(childId);
-      children.push({ id: childId, artifact });
-    }
 
-    return children;
+    // Children are independent files, so read them in bounded concurrent batches
+    return mapInBatches(childIds, MAX_CONCURRENT_READS, async (childId) => ({
+      id: childId,
+      artifact: await this.loadArtifact(childId),
+    }));
   }
 
   /**
@@ -390,16 +393,28 @@ export class QueryService {
    */
   async getAncestors(id: string): Promise<ArtifactWithId[]> {
     const segments = id.split(".");
-    const ancestors: ArtifactWithId[] = [];
 
     // Build ancestor chain from root to parent
+    const ancestorIds: string[] = [];
     for (let i = 1; i < segments.length; i++) {
-      const ancestorId = segments.slice(0, i).join(".");
-      const ancestor = await this.loadArtifact(ancestorId);
-      ancestors.push({ id: ancestorId, artifact: ancestor });
+      ancestorIds.push(segments.slice(0, i).join("."));
+    }
+
+    if (ancestorIds.length === 0) {
+      return [];
     }
 
-    return ancestors;
+    // Prime the path cache once so concurrent loads don't each rescan
+    await this.loadPathCache();
+
+    return mapInBatches(
+      ancestorIds,
+      MAX_CONCURRENT_READS,
+      async (ancestorId) => ({
+        id: ancestorId,
+        artifact: await this.loadArtifact(ancestorId),
+      }),
+    );
   }
 
   /**
@@ -433,11 +448,14 @@ export class QueryService {
     let siblings: ArtifactWithId[];
     if (!parentId) {
       const rootIds = await this.getChildIds();
-      siblings = [];
-      for (const rootId of rootIds) {
-        const artifact = await this.loadArtifact(rootId);
-        siblings.push({ id: rootId, artifact });
-      }
+      siblings = await mapInBatches(
+        rootIds,
+        MAX_CONCURRENT_READS,
+        async (rootId) => ({
+          id: rootId,
+          artifact: await this.loadArtifact(rootId),
+        }),
+      );
     } else {
       siblings = await this.getChildren(parentId);
     }
@@ -446,6 +464,60 @@ export class QueryService {
     return siblings.filter((item) => item.id !== id);
   }
 
+  /**
+   * Finds a single artifact by its ID.
+   *
+   * Only the requested artifact file is read, so this is much cheaper than
+   * filtering the results of {@link findArtifacts} when the ID is known.
+   *
+   * Unreadable or invalid artifact files are treated as missing, matching
+   * the filter methods, which skip them.
+   *
+   * @param id - The artifact ID
+   * @returns The artifact with its ID, or null if no artifact has that ID or its file cannot be read
+   *
+   * @example
+   * ```ts
+   * const result = await queryService.findById("A.1.3");
+   * if (result) {
+   *   console.log(result.artifact.metadata.title);
+   * }
+   * ```
+   */
+  async findById(id: string): Promise<ArtifactWithId | null> {
+    const pathCache = await this.loadPathCache();
+    if (!pathCache.has(id)) {
+      return null;
+    }
+
+    try {
+      const artifact = await this.loadArtifact(id);
+      return { id, artifact };
+    } catch {
+      return null;
+    }
+  }
+
+  /**
+   * Returns the file path of an artifact.
+   *
+   * Uses the same path cache as the other query methods, so no extra
+   * directory scan is needed once the service has been used.
+   *
+   * @param id - The artifact ID
+   * @returns Absolute path to the artifact file, or null if no artifact has that ID
+   *
+   * @example
+   * ```ts
+   * const filePath = await queryService.getArtifactPath("A.1");
+   * // ".../.kodebase/artifacts/A.core/A.1.types/A.1.yml"
+   * ```
+   */
+  async getArtifactPath(id: string): Promise<string | null> {
+    const pathCache = await this.loadPathCache();
+    return pathCache.get(id) ?? null;
+  }
+
   /**
    * Finds artifacts by their current state.
    *
@@ -713,16 +785,13 @@ export class QueryService {
    */
   private async getAllArtifacts(): Promise<ArtifactWithId[]> {
     const pathCache = await this.loadPathCache();
-    const artifacts: ArtifactWithId[] = [];
 
-    for (const [id, _path] of pathCache.entries()) {
-      try {
-        const artifact = await this.loadArtifact(id);
-        artifacts.push({ id, artifact });
-      } catch {}
-    }
-
-    return artifacts;
+    // Read artifacts in bounded concurrent batches, skipping any that fail to load
+    return mapInBatchesSkippingErrors(
+      Array.from(pathCache.keys()),
+      MAX_CONCURRENT_READS,
+      async (id) => ({ id, artifact: await this.loadArtifact(id) }),
+    );
   }
 
   /**